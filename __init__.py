@@ -1 +1 @@
-from .league_of_elo import runMultiRegion
\ No newline at end of file
+from .league_of_elo import runMultiRegion, EloService, runMultiRegionAsync
\ No newline at end of file
@@ -1 +1,2 @@
-from .run_lol import runMultiRegion
\ No newline at end of file
+from .run_lol import runMultiRegion
+from .async_api import EloService, runMultiRegionAsync
\ No newline at end of file
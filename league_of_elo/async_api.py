@@ -0,0 +1,151 @@
+from . import run_lol
+from .elo import rating_system
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+from time import monotonic, strftime
+import asyncio
+import threading
+
+
+class _Run(object):
+    """An in-flight computation and the data generation it started on (None while queued)"""
+    def __init__(self):
+        self.task = None
+        self.generation = None
+
+
+class EloService(object):
+    """
+    Asyncio front end for runMultiRegion.
+    Computations run in an executor so the event loop stays responsive. Concurrent requests for the
+    same (region, stop_date, model, game_level) share one in-flight computation, and finished results
+    are kept in an LRU cache. Cache hits never reach Leaguepedia, so entries expire after ttl seconds
+    (None keeps them until evicted). The cache is also cleared when any computation fetches new match
+    data, or when invalidate() is called, e.g. from a hook that knows upstream data changed.
+    """
+    def __init__(self, max_cached=32, ttl=900, executor=None):
+        self.max_cached = max_cached
+        self.ttl = ttl
+        # A single worker by default: replays are CPU bound and concurrent runs would race on the cache files
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        self.results = OrderedDict()
+        self.pending = {}
+        self.loop = None
+        self._running = threading.local()
+        # Bumped whenever new data arrives; runs record it when their replay actually starts
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        run_lol.DataCache.addListener(self._onNewData)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    async def runMultiRegion(self, region, model=rating_system.Elo, stop_date=None, game_level=False):
+        stop_date = stop_date or strftime('%Y-%m-%d')
+        key = (region, stop_date, model, game_level)
+        cached = self._getCached(key)
+        if cached is not None:
+            return deepcopy(cached)
+        if key not in self.pending:
+            run = _Run()
+            run.task = asyncio.ensure_future(self._compute(key, run))
+            self.pending[key] = run
+        # Shielded so a cancelled caller does not cancel the computation for everyone else waiting on it
+        result = await asyncio.shield(self.pending[key].task)
+        return deepcopy(result)
+
+    def invalidate(self, source=None, generation=None):
+        """
+        Drop cached results and detach computations that started replaying before the new data
+        arrived, so later requests start fresh ones. Computations that start afterwards, including
+        those still queued on the executor, read the new data, and so does source, the computation
+        whose own fetch found it; all of these stay in flight and are cached.
+        generation identifies the new data; it is only passed for notifications from DataCache.
+        """
+        if generation is None:
+            generation = self._nextGeneration()
+        self.results.clear()
+        self.pending = {key: run for key, run in self.pending.items()
+                        if key == source or run.generation is None or run.generation >= generation}
+
+    def close(self):
+        """
+        Stop listening for new data and drop all cached results. In-flight computations are detached:
+        callers already awaiting them still get their result, but nothing is cached afterwards.
+        An executor passed in by the caller is left running.
+        """
+        run_lol.DataCache.removeListener(self._onNewData)
+        self.results.clear()
+        self.pending = {}
+        if self._owns_executor:
+            self.executor.shutdown(wait=False)
+
+    def _getCached(self, key):
+        if key not in self.results:
+            return None
+        finished_at, result = self.results[key]
+        if self.ttl is not None and monotonic() - finished_at > self.ttl:
+            del self.results[key]
+            return None
+        self.results.move_to_end(key)
+        return result
+
+    async def _compute(self, key, run):
+        self.loop = asyncio.get_running_loop()
+        try:
+            result = await self.loop.run_in_executor(self.executor, partial(self._run, key, run))
+        finally:
+            current = self.pending.get(key) is run
+            if current:
+                del self.pending[key]
+        # A computation detached by invalidate() may predate the new data, so it is not cached
+        if current:
+            self.results[key] = (monotonic(), result)
+            while len(self.results) > self.max_cached:
+                self.results.popitem(last=False)
+        return result
+
+    def _nextGeneration(self):
+        with self._generation_lock:
+            self._generation += 1
+            return self._generation
+
+    def _run(self, key, run):
+        region, stop_date, model, game_level = key
+        # Stamped on the executor thread so it is ordered against notifications from other runs
+        with self._generation_lock:
+            run.generation = self._generation
+        self._running.key = key
+        try:
+            return run_lol.runMultiRegion(region, model, stop_date, game_level)
+        finally:
+            self._running.key = None
+
+    def _onNewData(self, season):
+        # Called from the executor thread that fetched the data; _running tells whether it was one of ours
+        source = getattr(self._running, 'key', None)
+        generation = self._nextGeneration()
+        if not self.loop or self.loop.is_closed():
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.invalidate, source, generation)
+        except RuntimeError:
+            # The loop closed after the check above
+            pass
+
+
+_default_service = None
+
+
+async def runMultiRegionAsync(region, model=rating_system.Elo, stop_date=None, game_level=False):
+    global _default_service
+    if not _default_service:
+        _default_service = EloService()
+    return await _default_service.runMultiRegion(region, model, stop_date, game_level)
@@ -1,9 +1,29 @@
 from .team import *
 from .rating_system import RatingSystem
 from statistics import mean
+from itertools import islice
+from time import perf_counter
 import re
 
 
+class IngestStats(object):
+    """Counters for a streamed ingestion run"""
+    def __init__(self):
+        self.rows = 0
+        self.rated = 0
+        self.invalid = 0
+        self.seconds = 0.0
+
+    def rowsPerSecond(self):
+        if not self.seconds:
+            return 0.0
+        return self.rows / self.seconds
+
+    def __repr__(self):
+        return (f"{self.rows} rows ({self.rated} rated, {self.invalid} invalid) in {self.seconds:.2f}s, "
+                f"{self.rowsPerSecond():.0f} rows/s")
+
+
 class League(object):
     """League class manages teams and historical ratings"""
     def __init__(self, league_name:str, rating_system:RatingSystem):
@@ -14,6 +34,7 @@ class League(object):
         self.alignment = [0]
         self.season_boundary = []
         self.seasons = []
+        self._team_lookup = {}
 
     def __repr__(self):
         team_table = []
@@ -47,24 +68,43 @@ class League(object):
 
     def loadGames(self, results, playoffs=False, using_ids=False):
         for result in results:
-            t1, t2, t1s, t2s, date, best_of, match_round = result
-            if not t1s or not match_round:
-                continue
-            try:
-                if using_ids:
-                    t1 = self._getTeam(team_id=t1)
-                    t2 = self._getTeam(team_id=t2)
-                else:
-                    t1 = self._getTeam(team_name=t1)
-                    t2 = self._getTeam(team_name=t2)
-            except ValueError:
-                # print(f"Unknown team. Ignoring match. {t1}, {t2}")
-                continue
-
-            winloss_args = (t1.getRating(), t2.getRating(), int(t1s), int(t2s))
-            t1_updated, t2_updated = self.rating_system.process_outcome(*winloss_args)
-            t1.updateRating(t1_updated)
-            t2.updateRating(t2_updated)
+            self._loadGame(result, using_ids)
+
+    def loadGameStream(self, results, chunk_size=10000, using_ids=False, keep_history=True):
+        """
+        Rate matches pulled lazily from an iterable of result tuples.
+        Rows are consumed chunk_size at a time so only one chunk is held in memory,
+        and the team names of each chunk are resolved to teams once before it is replayed.
+        With keep_history=False teams only keep their season start and current rating,
+        so memory no longer grows with the number of rows.
+        Unlike loadGames, rows don't need a match round, and rows whose scores aren't
+        integers are counted as invalid and skipped rather than aborting the stream.
+        @return IngestStats for the rows consumed.
+        """
+        results = iter(results)
+        stats = IngestStats()
+        start = perf_counter()
+        while True:
+            chunk = list(islice(results, chunk_size))
+            if not chunk:
+                break
+            teams = self._resolveTeams(chunk, using_ids)
+            for t1, t2, t1s, t2s, date, best_of, match_round in chunk:
+                if not self._hasResult(t1s):
+                    continue
+                try:
+                    t1s, t2s = int(t1s), int(t2s)
+                except (TypeError, ValueError):
+                    # e.g. a missing Team2Score or a "FF"/"W" forfeit
+                    stats.invalid += 1
+                    continue
+                if t1 not in teams or t2 not in teams:
+                    continue
+                self._rateMatch(teams[t1], teams[t2], t1s, t2s, keep_history)
+                stats.rated += 1
+            stats.rows += len(chunk)
+        stats.seconds = perf_counter() - start
+        return stats
 
     def loadRosters(self, rosters):
         pass
@@ -104,6 +144,48 @@ class League(object):
 
 
     ## Private
+    def _loadGame(self, result, using_ids=False):
+        t1, t2, t1s, t2s, date, best_of, match_round = result
+        if not self._hasResult(t1s) or not match_round:
+            return
+        try:
+            if using_ids:
+                t1 = self._getTeam(team_id=t1)
+                t2 = self._getTeam(team_id=t2)
+            else:
+                t1 = self._getTeam(team_name=t1)
+                t2 = self._getTeam(team_name=t2)
+        except ValueError:
+            # print(f"Unknown team. Ignoring match. {t1}, {t2}")
+            return
+        self._rateMatch(t1, t2, t1s, t2s)
+
+    def _hasResult(self, t1_score):
+        # Scores may be numbers as well as strings, so a score of 0 still counts as played
+        return t1_score is not None and t1_score != ''
+
+    def _rateMatch(self, t1, t2, t1_score, t2_score, keep_history=True):
+        winloss_args = (t1.getRating(), t2.getRating(), int(t1_score), int(t2_score))
+        t1_updated, t2_updated = self.rating_system.process_outcome(*winloss_args)
+        t1.updateRating(t1_updated, keep_history)
+        t2.updateRating(t2_updated, keep_history)
+
+    def _resolveTeams(self, results, using_ids=False):
+        """Map every team name (or id) in results to its Team, leaving out unknown teams."""
+        names = set()
+        for result in results:
+            names.update(result[:2])
+        teams = {}
+        for name in names:
+            try:
+                if using_ids:
+                    teams[name] = self._getTeam(team_id=name)
+                else:
+                    teams[name] = self._getTeam(team_name=name)
+            except ValueError:
+                pass
+        return teams
+
     def _addTeam(self, team_info, region='Default'):
         try:
             existing_team = self._getTeam(team_id=team_info.id)
@@ -112,6 +194,7 @@ class League(object):
             self.teams[team_info.id] = Team(*team_info)
         else:
             existing_team.names.extend([team_info.name, team_info.abbrev])
+        self._team_lookup.clear()
 
     def _getNameFromAbbrev(self, abbrev):
         for id in self.teams:
@@ -119,12 +202,19 @@ class League(object):
                 return self.teams[id].name
 
     def _getTeam(self, team_name=None, team_id=None, default=None):
-        team = self.teams.get(team_name)
-        if not team:
-            for _, t in self.teams.items():
-                if team_name in t.names or team_id == t.team_id:
-                    team = t
-                    break
+        key = (team_name, team_id)
+        if key in self._team_lookup:
+            team = self._team_lookup[key]
+        else:
+            team = self.teams.get(team_name)
+            if not team:
+                for _, t in self.teams.items():
+                    if team_name in t.names or team_id == t.team_id:
+                        team = t
+                        break
+            if team:
+                # Only known teams are remembered so unknown names can't grow the lookup without bound
+                self._team_lookup[key] = team
         if not team:
             if not default:
                 raise ValueError(f'Team does not exist: {team_name}')
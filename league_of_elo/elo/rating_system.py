@@ -4,8 +4,10 @@ from abc import ABC, abstractmethod
 class RatingSystem(ABC):
     """Abstract rating system class"""
     def __init__(self):
-        self.brier = []
-        self.up_down = []
+        # Running totals rather than per-match lists, so long replays use constant memory
+        self.brier_total = 0.0
+        self.forecasts = 0
+        self.upsets_avoided = 0
 
     @abstractmethod
     def predict(self, t1_rating:int, t2_rating:int):
@@ -24,15 +26,20 @@ class RatingSystem(ABC):
         pass
 
     def getBrier(self):
-        brier = sum(self.brier)/len(self.brier)
+        brier = self.brier_total/self.forecasts
         return f"Brier Score: {brier:.4f}"
 
     def getUpDown(self):
-        up = sum(self.up_down)
-        down = len(self.up_down) - up
+        up = self.upsets_avoided
+        down = self.forecasts - up
         pct = up/(up+down)*100
         return f"Up Down Record: {up} - {down} ({pct:.2f}%)"
 
+    def _recordForecast(self, forecast_delta):
+        self.upsets_avoided += forecast_delta < .5
+        self.brier_total += forecast_delta**2
+        self.forecasts += 1
+
 
 class Elo(RatingSystem):
     """Elo rating system"""
@@ -54,8 +61,7 @@ class Elo(RatingSystem):
 
         def process_winner(winner_rating, loser_rating, winner_score, loser_score):
             forecast_delta = 1 - self.predict(winner_rating, loser_rating)
-            self.up_down.append(forecast_delta < .5)
-            self.brier.append(forecast_delta**2)
+            self._recordForecast(forecast_delta)
             match_score_mult = 1 if not self.score_mult else score_multiplier(winner_score, loser_score)
             rating_delta = self.K * forecast_delta * match_score_mult
             return (rating_delta, -rating_delta)
@@ -80,8 +86,7 @@ class Naive(RatingSystem):
     def process_outcome(self, t1_rating:int, t2_rating:int, t1_score:int, t2_score:int):
         def process_winner(winner_rating, loser_rating, winner_score, loser_score):
             forecast_delta = 1 - self.predict(winner_rating, loser_rating)
-            self.up_down.append(forecast_delta < .5)
-            self.brier.append(forecast_delta**2)
+            self._recordForecast(forecast_delta)
             return (self.K * forecast_delta, -self.K * forecast_delta)
 
         if t1_score > t2_score or (t1_score == t2_score and t1_rating < t2_rating):
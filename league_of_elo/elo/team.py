@@ -21,9 +21,13 @@ class Team(object):
     def getRating(self):
         return self.team_rating
 
-    def updateRating(self, correction):
+    def updateRating(self, correction, keep_history=True):
         self.team_rating += correction
-        self.rating_history[-1].append(self.team_rating)
+        if keep_history or len(self.rating_history[-1]) < 2:
+            self.rating_history[-1].append(self.team_rating)
+        else:
+            # Keep only the season's starting rating and the current one
+            self.rating_history[-1][-1] = self.team_rating
         self.games_played += 1
 
     def __repr__(self):
@@ -38,7 +42,7 @@ class DummyTeam(Team):
     def __init__(self, starting_rating=1500):
         super().__init__(-1, None, 'DummyTeam', None, starting_rating)
 
-    def updateRating(self, correction):
+    def updateRating(self, correction, keep_history=True):
         pass
 
 
@@ -90,8 +94,8 @@ class PlayerTeam(Team):
             0.15 * np.average(list(map(Player.getRating, self.sup))))
         return rating
 
-    def updateRating(self, correction):
-        super(PlayerTeam, self).updateRating(correction)
+    def updateRating(self, correction, keep_history=True):
+        super(PlayerTeam, self).updateRating(correction, keep_history)
         for player in self.top + self.jng + self.mid + self.bot + self.sup:
             player.updateRating(correction)
 
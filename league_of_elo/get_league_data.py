@@ -10,6 +10,18 @@ class Leaguepedia_DB(object):
                 **query_dict)
         return [row['title'] for row in response['cargoquery']]
 
+    def _queryAll(self, query_dict, page_size=500):
+        rows = []
+        while True:
+            response = self.lpdb.api('cargoquery',
+                    limit = page_size,
+                    offset = len(rows),
+                    **query_dict)
+            page = [row['title'] for row in response['cargoquery']]
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+
     def getRegions(self):
         query_dict = {
             'tables':'Tournaments',
@@ -75,20 +87,56 @@ class Leaguepedia_DB(object):
             rosters.append([team, roster])
         return rosters
 
-# Unused (for now)
     def get_season_games(self, season):
-        r = self.lpdb.api('cargoquery',
-                limit = 'max',
-                tables = "MatchScheduleGame=MSG,MatchSchedule=MS",
-                fields = "MS.Team1,MS.Team2,MS.Team1Score,MS.Team2Score,MSG.GameID_Wiki",
-                where = f'MS.ShownName="{season}"',
-                join_on = "MSG.UniqueMatch=MS.UniqueMatch",
-                order_by = "MS.DateTime_UTC ASC")
-
-        matches = [m['title'].values()
-                   for m in r['cargoquery']]
-        return matches
+        """
+        Individual game results for a season, as one result tuple per game.
+        Games and matches are fetched in two bulk queries and joined locally on MatchId.
+        Matches without any decided game (older seasons, forfeits) fall back to their series result.
+        """
+        match_query = {
+            'tables': 'MatchSchedule=MS, Tournaments=T',
+            'fields': 'MS.MatchId=MatchId,MS.Team1=Team1,MS.Team2=Team2,MS.Team1Score=Team1Score,'
+                      'MS.Team2Score=Team2Score,MS.DateTime_UTC=Date,MS.BestOf=BestOf,MS.Tab=Tab',
+            'join_on': 'T.OverviewPage=MS.OverviewPage',
+            'where': f'T.Name="{season}"',
+            # Offset paging needs a total order, otherwise pages can overlap or skip rows
+            'order_by': 'MS.DateTime_UTC ASC, MS.MatchId ASC'}
+        game_query = {
+            'tables': 'MatchScheduleGame=MSG, Tournaments=T',
+            'fields': 'MSG.MatchId=MatchId,MSG.N_GameInMatch=GameN,MSG.Winner=Winner',
+            'join_on': 'T.OverviewPage=MSG.OverviewPage',
+            'where': f'T.Name="{season}"',
+            'order_by': 'MSG.MatchId ASC, MSG.N_GameInMatch ASC'}
+
+        games_by_match = {}
+        for g in self._queryAll(game_query):
+            games_by_match.setdefault(g['MatchId'], []).append(g)
+
+        games = []
+        for m in self._queryAll(match_query):
+            match_games = sorted(games_by_match.get(m['MatchId'], []), key=lambda g: int(g['GameN'] or 0))
+            match_games = [g for g in match_games if g['Winner'] in ('1', '2')]
+            if not match_games:
+                games.append((m['Team1'],
+                              m['Team2'],
+                              m['Team1Score'],
+                              m['Team2Score'],
+                              m['Date'],
+                              m['BestOf'],
+                              m['Tab']))
+                continue
+            for g in match_games:
+                t1_won = g['Winner'] == '1'
+                games.append((m['Team1'],
+                              m['Team2'],
+                              '1' if t1_won else '0',
+                              '0' if t1_won else '1',
+                              m['Date'],
+                              '1',
+                              m['Tab']))
+        return games
 
+# Unused (for now)
     def get_rosters_seasons(self, season):
         r = self.lpdb.api('cargoquery',
                 limit = 'max',
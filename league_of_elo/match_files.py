@@ -0,0 +1,78 @@
+import csv
+import gzip
+import json
+from pathlib import Path
+
+
+# Columns in the order League.loadGames expects them, named as in Leaguepedia's MatchSchedule
+MATCH_FIELDS = ['Team1', 'Team2', 'Team1Score', 'Team2Score', 'DateTime UTC', 'BestOf', 'Tab']
+# The teams and scores must be present; the remaining columns are optional
+REQUIRED_FIELD_COUNT = 4
+
+
+def _open(path):
+    path = Path(path)
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', newline='')
+    return open(path, 'r', newline='')
+
+
+def _checkFields(path, columns, fields):
+    missing = [field for field in fields[:REQUIRED_FIELD_COUNT] if field not in columns]
+    if missing:
+        raise ValueError(f'Match file {path} is missing required columns: {", ".join(missing)}')
+
+
+def _fileFormat(path):
+    suffixes = Path(path).suffixes
+    if suffixes and suffixes[-1] == '.gz':
+        suffixes = suffixes[:-1]
+    return suffixes[-1].lstrip('.').lower() if suffixes else ''
+
+
+def readCsvMatches(path, fields=MATCH_FIELDS):
+    """Yield match result tuples from a CSV file with a header row, one row at a time."""
+    with _open(path) as match_file:
+        reader = csv.DictReader(match_file)
+        _checkFields(path, reader.fieldnames or [], fields)
+        for row in reader:
+            yield tuple(row.get(field) for field in fields)
+
+
+def readJsonlMatches(path, fields=MATCH_FIELDS):
+    """Yield match result tuples from a file holding one JSON object per line."""
+    checked = False
+    with _open(path) as match_file:
+        for line in match_file:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if not checked:
+                # JSONL has no header, so the first object stands in for one
+                _checkFields(path, row, fields)
+                checked = True
+            yield tuple(row.get(field) for field in fields)
+
+
+def readMatches(paths, fields=MATCH_FIELDS):
+    """Yield match result tuples from each CSV/JSONL file in turn, picking the reader by extension."""
+    readers = {
+        'csv': readCsvMatches,
+        'jsonl': readJsonlMatches,
+        'ndjson': readJsonlMatches}
+
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    for path in paths:
+        reader = readers.get(_fileFormat(path))
+        if not reader:
+            raise ValueError(f'Unsupported match file: {path}')
+        yield from reader(path, fields)
+
+
+if __name__ == '__main__':
+    import sys
+    from itertools import islice
+    from pprint import pprint
+
+    pprint(list(islice(readMatches(sys.argv[1:]), 10)))
@@ -2,6 +2,7 @@
 
 from .elo import league, rating_system
 from .get_league_data import Leaguepedia_DB
+from .match_files import readMatches
 
 from typing import Dict
 from time import strftime
@@ -10,6 +11,9 @@ import argparse
 import re
 import pickle
 import os
+import threading
+import warnings
+import weakref
 
 
 SRC_PATH = Path(__file__).resolve().parent
@@ -34,10 +38,27 @@ IGNORE_TOURNAMENTS = [
 
 
 class DataCache():
+    # Weak references to callables taking a season name, invoked whenever a fetch brings in results that
+    # differ from the cache. Use addListener/removeListener rather than touching this directly.
+    listeners = []
+    _listeners_lock = threading.Lock()
+
     def __init__(self, regen=False):
         self.lpdb = None
         self.force_lpdb = regen
 
+    @classmethod
+    def addListener(cls, listener):
+        # Bound methods are held weakly so listeners that are never removed don't keep their owner alive
+        ref = weakref.WeakMethod(listener) if hasattr(listener, '__self__') else (lambda: listener)
+        with cls._listeners_lock:
+            cls.listeners = cls.listeners + [ref]
+
+    @classmethod
+    def removeListener(cls, listener):
+        with cls._listeners_lock:
+            cls.listeners = [ref for ref in cls.listeners if ref() not in (None, listener)]
+
     def lpdb_connect(self):
         self.lpdb = Leaguepedia_DB()
 
@@ -49,8 +70,9 @@ class DataCache():
         season_list = list(filter(lambda x: all([t not in x for t in IGNORE_TOURNAMENTS]), season_list))
         return season_list
 
-    def getMatchResults(self, season, force_fetch=False):
-        results_file = Path(CACHE_PATH / 'results' / f'{season}.p')
+    def getMatchResults(self, season, force_fetch=False, game_level=False):
+        results_name = f'{season}.games.p' if game_level else f'{season}.p'
+        results_file = Path(CACHE_PATH / 'results' / results_name)
         os.makedirs(os.path.dirname(results_file), exist_ok=True)
 
         if results_file.is_file() and not force_fetch:
@@ -60,12 +82,31 @@ class DataCache():
             # print(f'Fetching: {season}')
             if not self.lpdb:
                 self.lpdb_connect()
-            results = self.lpdb.getSeasonResults(season)
+            if game_level:
+                results = self.lpdb.get_season_games(season)
+            else:
+                results = self.lpdb.getSeasonResults(season)
+            previous = pickle.load(open(results_file, 'rb')) if results_file.is_file() else None
             pickle.dump(results, open(results_file, 'wb'))
+            if results != previous:
+                self._notifyNewData(season)
         return results
 
-
-def runMultiRegion(region, model = rating_system.Elo, stop_date = strftime('%Y-%m-%d')):
+    def _notifyNewData(self, season):
+        for ref in DataCache.listeners:
+            listener = ref()
+            if listener is None:
+                continue
+            # A failing listener must not abort the fetch or replay that noticed the new data
+            try:
+                listener(season)
+            except Exception as e:
+                warnings.warn(f'New data listener failed for {season}: {e!r}')
+        with DataCache._listeners_lock:
+            DataCache.listeners = [ref for ref in DataCache.listeners if ref() is not None]
+
+
+def runMultiRegion(region, model = rating_system.Elo, stop_date = strftime('%Y-%m-%d'), game_level = False):
     regions = ['NA', 'EU', 'KR', 'CN', 'INT'] if region == 'INT' else [region]
     start_year = 2010
     rating_model = model()
@@ -106,7 +147,7 @@ def runMultiRegion(region, model = rating_system.Elo, stop_date = strftime('%Y-%
             if season == split_transitions[-1]:
                 force_fetch = True
             last_year = year
-        results = cache.getMatchResults(season, force_fetch=force_fetch)
+        results = cache.getMatchResults(season, force_fetch=force_fetch, game_level=game_level)
         rating_league.loadGames(results, 'Playoffs' in season)
 
     result = rating_league.genResult()
@@ -114,6 +155,22 @@ def runMultiRegion(region, model = rating_system.Elo, stop_date = strftime('%Y-%
     return result
 
 
+def runMatchFiles(region, match_files, model = rating_system.Elo, chunk_size = 10000, keep_history = False):
+    regions = ['NA', 'EU', 'KR', 'CN', 'INT'] if region == 'INT' else [region]
+    rating_model = model()
+    rating_league = league.League('_'.join(regions), rating_model)
+    for region in regions:
+        teamfile, _ = TEAMFILES.get(region)
+        rating_league.loadTeams(CFG_PATH / teamfile, region)
+
+    # Files are read lazily and, without history, per-team state stays fixed, so memory doesn't grow with file size
+    stats = rating_league.loadGameStream(readMatches(match_files), chunk_size=chunk_size,
+                                         keep_history=keep_history)
+
+    result = rating_league.genResult()
+    return result, stats
+
+
 def parseArgs() -> Dict:
     parser = argparse.ArgumentParser()
     parser.add_argument('region', choices=['NA', 'EU', 'KR', 'CN', 'INT', 'ALL'], default='INT',
@@ -123,6 +180,10 @@ def parseArgs() -> Dict:
     parser.add_argument('--naive_model', dest='model', action='store_const',
                         const=rating_system.Naive, default=rating_system.Elo,
                         help='Use the naive rating system rather than Elo')
+    parser.add_argument('--game_level', action='store_true',
+                        help='Rate every game individually rather than each series as a whole.')
+    parser.add_argument('--match_files', nargs='+', metavar='FILE',
+                        help='Rate matches from CSV/JSONL files instead of Leaguepedia.')
 
     return vars(parser.parse_args())
 
@@ -132,10 +193,14 @@ if __name__ == '__main__':
 
     print(args)
 
-    if args['region'] == 'ALL':
-        for region in TEAMFILES:
-            # print(f'Running {region}')
-            args['region'] = region
+    match_files = args.pop('match_files')
+    regions = list(TEAMFILES) if args['region'] == 'ALL' else [args['region']]
+
+    for region in regions:
+        # print(f'Running {region}')
+        args['region'] = region
+        if match_files:
+            _, stats = runMatchFiles(region, match_files, args['model'])
+            print(f'{region}: {stats}')
+        else:
             runMultiRegion(**args)
-    else:
-        runMultiRegion(**args)